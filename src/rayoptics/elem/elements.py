@@ -395,6 +395,37 @@ def full_profile(profile, is_flipped, edge_extent,
     return prf
 
 
+def offset_and_close_profiles(profile_polys, offset, has_hole):
+    """Shift the 2nd profile by *offset* and join the profiles into a polygon.
+
+    The profiles in *profile_polys* are converted in place to numpy arrays, so
+    the shifted 2nd profile is retained for use as a polyline.
+
+    Args:
+
+        profile_polys: list of the 2 profiles, as returned by full_profile
+        offset: axial shift applied to the 2nd profile
+        has_hole: if True, each profile is a tuple of lower and upper segments
+
+    Returns:
+        closed polygon, or a tuple of closed polygons if *has_hole*
+    """
+    if has_hole:
+        poly1, poly2 = [tuple(np.array(seg, dtype=np.float64) for seg in prf)
+                        for prf in profile_polys]
+        for p2 in poly2:
+            p2[:, 0] += offset
+        profile_polys[:] = poly1, poly2
+        return tuple(np.concatenate((p1, p2, p1[:1]))
+                     for p1, p2 in zip(poly1, poly2))
+    else:
+        poly1, poly2 = [np.array(prf, dtype=np.float64)
+                        for prf in profile_polys]
+        poly2[:, 0] += offset
+        profile_polys[:] = poly1, poly2
+        return np.concatenate((poly1, poly2, poly1[:1]))
+
+
 def use_flat(do_flat, is_concave):
     if do_flat == 'always':
         return True
@@ -748,22 +779,8 @@ class Element(Part):
                              flat2, hole_id=self.hole_sd, dir=-1)
         self.profile_polys.append(poly2)
 
-        if self.hole_sd is None:
-            for p in poly2:
-                p[0] += self.gap.thi
-            poly1 += poly2
-            poly1.append(poly1[0])
-            poly = poly1
-        else:
-            poly = []
-            for p1, p2 in zip(poly1, poly2):
-                for p in p2:
-                    p[0] += self.gap.thi
-                p1 += p2
-                p1.append(p1[0])
-                poly.append(p1)
-            poly = tuple(poly)
-
+        poly = offset_and_close_profiles(self.profile_polys, self.gap.thi,
+                                         self.hole_sd is not None)
         return poly
 
     def render_handles(self, opt_model):
@@ -1014,22 +1031,8 @@ class Mirror(Part):
 
         offset = self.substrate_offset()
 
-        if self.hole_sd is None:
-            for p in poly2:
-                p[0] += offset
-            poly1 += poly2
-            poly1.append(poly1[0])
-            poly = poly1
-        else:
-            poly = []
-            for p1, p2 in zip(poly1, poly2):
-                for p in p2:
-                    p[0] += offset
-                p1 += p2
-                p1.append(p1[0])
-                poly.append(p1)
-            poly = tuple(poly)
-
+        poly = offset_and_close_profiles(self.profile_polys, offset,
+                                         self.hole_sd is not None)
         return poly
 
     def render_handles(self, opt_model):
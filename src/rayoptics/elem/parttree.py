@@ -347,6 +347,10 @@ def elements_from_sequence(ele_model, seq_model, part_tree):
         # initialize part tree using the seq_model
         part_tree.init_from_sequence(seq_model)
     g_tfrms = seq_model.compute_global_coords(1)
+    # test each gap medium for air once, the test is reused by process_airgap
+    air_gaps = [g.medium.name().lower() == 'air' for g in seq_model.gaps]
+    # surface ods are looked up by sequence index when sizing elements
+    ifc_ods = [s.surface_od() for s in seq_model.ifcs]
     buried_reflector = False
     eles = []
     path = seq_model.path()
@@ -356,12 +360,13 @@ def elements_from_sequence(ele_model, seq_model, part_tree):
             g_tfrm = g_tfrms[i]
     
             if g is not None:
-                if g.medium.name().lower() == 'air':
+                if air_gaps[i]:
                     num_eles = len(eles)
                     if num_eles == 0:
                         process_airgap(
                             ele_model, seq_model, part_tree,
-                            i, g, z_dir, ifc, g_tfrm, add_ele=True)
+                            i, g, z_dir, ifc, g_tfrm, add_ele=True,
+                            air_gaps=air_gaps)
                     else:
                         if buried_reflector is True:
                             num_eles = num_eles//2
@@ -370,7 +375,7 @@ def elements_from_sequence(ele_model, seq_model, part_tree):
     
                         if num_eles == 1:
                             i1, s1, g1, z_dir1, g_tfrm1 = eles[0]
-                            sd = max(s1.surface_od(), ifc.surface_od())
+                            sd = max(ifc_ods[i1], ifc_ods[i])
                             e = elements.Element(s1, ifc, g1, sd=sd, tfrm=g_tfrm1,
                                                  idx=i1, idx2=i)
     
@@ -436,7 +441,7 @@ def elements_from_sequence(ele_model, seq_model, part_tree):
                     eles.append((i, ifc, g, z_dir, g_tfrm))
             else:
                 process_airgap(ele_model, seq_model, part_tree,
-                               i, g, z_dir, ifc, g_tfrm)
+                               i, g, z_dir, ifc, g_tfrm, air_gaps=air_gaps)
 
     # rename and tag the Image space airgap
     node = part_tree.parent_node((seq_model.gaps[-1], seq_model.z_dir[-1]))
@@ -449,7 +454,7 @@ def elements_from_sequence(ele_model, seq_model, part_tree):
 
 
 def process_airgap(ele_model, seq_model, part_tree, i, g, z_dir, s, g_tfrm,
-                   add_ele=True):
+                   add_ele=True, *, air_gaps):
     if s.interact_mode == 'reflect' and add_ele:
         sd = s.surface_od()
         z_dir = seq_model.z_dir[i]
@@ -473,8 +478,7 @@ def process_airgap(ele_model, seq_model, part_tree, i, g, z_dir, s, g_tfrm,
             dummy_label = 'Image'
             dummy_tag = '#image'
         else:  # i > 0
-            gp = seq_model.gaps[i-1]
-            if gp.medium.name().lower() == 'air':
+            if air_gaps[i-1]:
                 add_dummy = True
                 if seq_model.stop_surface == i:
                     dummy_label = 'Stop'
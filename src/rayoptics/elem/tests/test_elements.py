@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+""" tests for building element outlines from surface profiles
+
+.. codeauthor: Michael J. Hayford
+"""
+
+import unittest
+import numpy as np
+import numpy.testing as npt
+from rayoptics.elem.elements import offset_and_close_profiles
+
+
+class OffsetAndCloseProfilesTestCase(unittest.TestCase):
+    def test_no_hole(self):
+        prf1 = [[0., -1.], [0.1, 0.], [0., 1.]]
+        prf2 = [[0., 1.], [-0.1, 0.], [0., -1.]]
+        profile_polys = [prf1, prf2]
+        poly = offset_and_close_profiles(profile_polys, 2., False)
+
+        npt.assert_array_equal(poly, [[0., -1.], [0.1, 0.], [0., 1.],
+                                      [2., 1.], [1.9, 0.], [2., -1.],
+                                      [0., -1.]])
+        # the profiles are retained as arrays, the 2nd one offset, and
+        #  aren't extended by the closed outline
+        npt.assert_array_equal(profile_polys[0], prf1)
+        npt.assert_array_equal(profile_polys[1],
+                               [[2., 1.], [1.9, 0.], [2., -1.]])
+
+    def test_hole(self):
+        prf1 = ([[0., -2.], [0., -1.]], [[0., 1.], [0., 2.]])
+        prf2 = ([[0., -1.], [0., -2.]], [[0., 2.], [0., 1.]])
+        profile_polys = [prf1, prf2]
+        poly = offset_and_close_profiles(profile_polys, 3., True)
+
+        self.assertIsInstance(poly, tuple)
+        self.assertEqual(len(poly), 2)
+        npt.assert_array_equal(poly[0], [[0., -2.], [0., -1.], [3., -1.],
+                                         [3., -2.], [0., -2.]])
+        npt.assert_array_equal(poly[1], [[0., 1.], [0., 2.], [3., 2.],
+                                         [3., 1.], [0., 1.]])
+        npt.assert_array_equal(profile_polys[0][1], prf1[1])
+        npt.assert_array_equal(profile_polys[1][0],
+                               [[3., -1.], [3., -2.]])
+        self.assertTrue(all(isinstance(seg, np.ndarray)
+                            for prf in profile_polys for seg in prf))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=3)
@@ -203,19 +203,16 @@ def smooth_plot_data(f_x, f_y, num_points=100):
 def trace_ray_fan(opt_model, fan_rng, fld, wvl, foc,
                   output_filter=None, rayerr_filter=None, **kwargs):
     """Trace a fan of rays, according to fan_rng. """
-    start = np.array(fan_rng[0])
-    stop = fan_rng[1]
-    num = fan_rng[2]
-    step = (stop - start)/(num - 1)
+    pupils = np.linspace(fan_rng[0], fan_rng[1], fan_rng[2])
+    ray_start_data = trace.trace_base_setup(opt_model, fld)
     fan = []
-    for r in range(num):
-        pupil = np.array(start)
+    for pupil in pupils:
         ray_result = trace.trace_safe(opt_model, pupil, fld, wvl, 
                                       output_filter, rayerr_filter, 
-                                      use_named_tuples=True, **kwargs)
+                                      use_named_tuples=True,
+                                      ray_start_data=ray_start_data, **kwargs)
         if ray_result is not None:
             fan.append([pupil[0], pupil[1], ray_result])
-        start += step
     return fan
 
 
@@ -423,10 +420,11 @@ def trace_ray_list(opt_model, pupil_coords, fld, wvl, foc,
     """Trace a list of rays at fld and wvl and return ray_pkgs in a list."""
 
     ray_list = []
+    ray_start_data = trace.trace_base_setup(opt_model, fld)
     for pupil in pupil_coords:
         ray_result = trace.trace_safe(opt_model, pupil, fld, wvl, 
                                       output_filter, rayerr_filter, 
-                                      **kwargs)
+                                      ray_start_data=ray_start_data, **kwargs)
         if ray_result is not None:
             ray_list.append([pupil[0], pupil[1], ray_result])
         else:  # ray outside pupil or failed
@@ -617,30 +615,30 @@ class RayGrid():
 def trace_ray_grid(opt_model, grid_rng, fld, wvl, foc, append_if_none=True,
                    output_filter=None, rayerr_filter=None, **kwargs):
     """Trace a grid of rays at fld and wvl and return ray_pkgs in 2d list."""
-    start = np.array(grid_rng[0])
+    start = grid_rng[0]
     stop = grid_rng[1]
     num = grid_rng[2]
-    step = np.array((stop - start)/(num - 1))
+    pupil_x = np.linspace(start[0], stop[0], num)
+    pupil_y = np.linspace(start[1], stop[1], num)
+    pupils = np.stack(np.meshgrid(pupil_x, pupil_y, indexing='ij'), axis=-1)
+    ray_start_data = trace.trace_base_setup(opt_model, fld)
     grid = []
-    for i in range(num):
+    for pupil_row in pupils:
         grid_row = []
 
-        for j in range(num):
-            pupil = np.array(start)
+        for pupil in pupil_row:
             ray_result = trace.trace_safe(opt_model, pupil, fld, wvl, 
                                           output_filter, rayerr_filter, 
-                                          apply_vignetting=False, **kwargs)
+                                          apply_vignetting=False,
+                                          ray_start_data=ray_start_data,
+                                          **kwargs)
             if ray_result is not None:
                     grid_row.append([pupil[0], pupil[1], ray_result])
             else:  # ray outside pupil or failed
                 if append_if_none:
                     grid_row.append([pupil[0], pupil[1], None])
 
-            start[1] += step[1]
-
         grid.append(grid_row)
-        start[0] += step[0]
-        start[1] = grid_rng[0][1]
 
     return grid
 
@@ -17,7 +17,6 @@ from rayoptics.optical import model_enums
 import rayoptics.optical.model_constants as mc
 from opticalglass.spectral_lines import get_wavelength
 import rayoptics.util.colour_system as cs
-from rayoptics.util.misc_math import transpose
 import rayoptics.gui.util as gui_util
 from rayoptics.util import colors
 srgb = cs.cs_srgb
@@ -195,6 +194,19 @@ class OpticalSpecs:
         list_parax_trace(self.opt_model, **kwargs)
 
 
+# accent colors used to render a spectrum of n wavelengths, ordered from
+#  short to long wavelengths. The last palette is used for longer spectra.
+wvl_render_palettes = {
+    1: ['green'],
+    2: ['blue', 'red'],
+    3: ['blue', 'green', 'red'],
+    4: ['blue', 'green', 'yellow', 'red'],
+    5: ['violet', 'cyan', 'green', 'yellow', 'red'],
+    6: ['violet', 'cyan', 'green', 'yellow', 'red', 'magenta'],
+    7: ['violet', 'blue', 'cyan', 'green', 'yellow', 'red', 'magenta'],
+    }
+
+
 class WvlSpec:
     """ Class defining a spectral region
 
@@ -255,43 +267,26 @@ class WvlSpec:
         self.wavelengths.append(get_wavelength(wl))
         self.spectral_wts.append(wt)
         self.sort_spectrum()
+        self.calc_colors()
 
     def sort_spectrum(self):
-        spectrum = [[wl, wt] for wl, wt in zip(self.wavelengths, 
-                                               self.spectral_wts)]
-        spectrum.sort(key=lambda w: w[0])
-        spectrumT = transpose(spectrum)
-        self.wavelengths = spectrumT[0]
-        self.spectral_wts = spectrumT[1]
-        
+        """ sort the spectrum by wavelength, keeping the central wavelength """
+        ref_wvl = self.central_wvl
+        spectrum = sorted(zip(self.wavelengths, self.spectral_wts),
+                          key=lambda w: w[0])
+        self.wavelengths = [wl for wl, wt in spectrum]
+        self.spectral_wts = [wt for wl, wt in spectrum]
+        self.reference_wvl = self.wavelengths.index(ref_wvl)
+
     def calc_colors(self):
-        accent = colors.accent_colors()
-        self.render_colors = []
         num_wvls = len(self.wavelengths)
-        if num_wvls == 1:
-            self.render_colors.append(accent['green'])
-        elif num_wvls > 1:
-            step = 1 if self.wavelengths[0] < self.wavelengths[-1] else -1
-            if num_wvls == 2:
-                c = ['blue', 'red']
-            elif num_wvls == 3:
-                c = ['blue', 'green', 'red']
-            elif num_wvls == 4:
-                c = ['blue', 'green', 'yellow', 'red']
-            elif num_wvls == 5:
-                c = ['violet', 'cyan', 'green', 'yellow', 'red']
-            elif num_wvls == 6:
-                c = ['violet', 'cyan', 'green', 'yellow', 'red', 'magenta']
-            else:
-                c = ['violet', 'blue', 'cyan', 'green', 'yellow',
-                     'red', 'magenta']
-            self.render_colors = [accent[clr] for clr in c[::step]]
-        # else:
-        #     for w in self.wavelengths:
-        #         print("calc_colors", w)
-        #         rgb = srgb.wvl_to_rgb(w)
-        #         print("rgb", rgb)
-        #         self.render_colors.append(rgb)
+        if num_wvls == 0:
+            self.render_colors = []
+            return
+        accent = colors.accent_colors()
+        c = wvl_render_palettes[min(num_wvls, len(wvl_render_palettes))]
+        step = 1 if self.wavelengths[0] < self.wavelengths[-1] else -1
+        self.render_colors = [accent[clr] for clr in c[::step]]
 
 
 class PupilSpec:
@@ -357,6 +352,34 @@ class PupilSpec:
         self.key = ape_key
 
 
+def obj_pt_from_obj_angle(fld_coord, fod):
+    """ object point for a field angle (in degrees) in object space """
+    # fld_coord is a 3 vector with z=0; scalar trig beats the ufunc overhead
+    obj_dist = -(fod.obj_dist+fod.enp_dist)
+    return np.array([math.tan(math.radians(fld_coord[0]))*obj_dist,
+                     math.tan(math.radians(fld_coord[1]))*obj_dist,
+                     0.0])
+
+
+def obj_pt_from_obj_height(fld_coord, fod):
+    """ object point for an object height """
+    return fld_coord
+
+
+def obj_pt_from_img_height(fld_coord, fod):
+    """ object point for an image height, using the paraxial reduction """
+    return fod.red*fld_coord
+
+
+# map the (obj_img_key, value_key) part of FieldSpec.key to the function
+#  computing the object point, so obj_coords doesn't have to test the key
+obj_coords_fcts = {
+    ('object', 'angle'): obj_pt_from_obj_angle,
+    ('object', 'height'): obj_pt_from_obj_height,
+    ('image', 'height'): obj_pt_from_img_height,
+    }
+
+
 class FieldSpec:
     """ Field of view specification
 
@@ -479,17 +502,7 @@ class FieldSpec:
         field, obj_img_key, value_key = self.key
 
         fod = self.optical_spec.opt_model['ar']['parax_data'].fod
-        if obj_img_key == 'object':
-            if value_key == 'angle':
-                dir_tan = np.tan(np.deg2rad(fld_coord))
-                obj_pt = -dir_tan*(fod.obj_dist+fod.enp_dist)
-            elif value_key == 'height':
-                obj_pt = fld_coord
-        elif obj_img_key == 'image':
-            if value_key == 'height':
-                img_pt = fld_coord
-                obj_pt = fod.red*img_pt
-        return obj_pt
+        return obj_coords_fcts[obj_img_key, value_key](fld_coord, fod)
 
     def max_field(self):
         """ calculates the maximum field of view
@@ -588,21 +601,25 @@ class Field:
         return vig_bbox
 
     def apply_vignetting(self, pupil):
+        """ scale pupil coords by the vignetting factors for their quadrant """
         vig_pupil = pupil[:]
-        if pupil[0] < 0.0:
-            if self.vlx != 0.0:
-                vig_pupil[0] *= (1.0 - self.vlx)
-        else:
-            if self.vux != 0.0:
-                vig_pupil[0] *= (1.0 - self.vux)
-        if pupil[1] < 0.0:
-            if self.vly != 0.0:
-                vig_pupil[1] *= (1.0 - self.vly)
-        else:
-            if self.vuy != 0.0:
-                vig_pupil[1] *= (1.0 - self.vuy)
+        # scalar math is fastest for a single pupil; only assign when
+        #  vignetted, so unvignetted tuple pupils pass through unchanged
+        vx = self.vlx if pupil[0] < 0.0 else self.vux
+        if vx != 0.0:
+            vig_pupil[0] *= 1.0 - vx
+        vy = self.vly if pupil[1] < 0.0 else self.vuy
+        if vy != 0.0:
+            vig_pupil[1] *= 1.0 - vy
         return vig_pupil
 
+    def apply_vignetting_batch(self, pupils):
+        """ return an Nx2 array of vignetted coords for an Nx2 pupil array """
+        pupils = np.asarray(pupils, dtype=np.float64)[:, :2]
+        vig = np.where(pupils < 0.0,
+                       (self.vlx, self.vly), (self.vux, self.vuy))
+        return pupils * (1.0 - vig)
+
 
 class FocusRange:
     """ Focus range specification
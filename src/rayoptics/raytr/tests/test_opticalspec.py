@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+""" tests for WvlSpec spectrum editing
+
+.. codeauthor: Michael J. Hayford
+"""
+
+import unittest
+from pytest import approx
+from rayoptics.raytr.opticalspec import WvlSpec
+
+
+class WvlSpecAddTestCase(unittest.TestCase):
+    def test_add_below_central_wvl(self):
+        wvls = WvlSpec([('F', 1.), ('d', 1.), ('C', 1.)], ref_wl=1)
+        central_wvl = wvls.central_wvl
+        wvls.add('g', 0.5)
+
+        self.assertEqual(wvls.central_wvl, approx(central_wvl))
+        self.assertEqual(wvls.reference_wvl, 2)
+        self.assertEqual(wvls.wavelengths, sorted(wvls.wavelengths))
+        self.assertEqual(wvls.spectral_wts, [0.5, 1., 1., 1.])
+        self.assertEqual(len(wvls.render_colors), 4)
+
+    def test_add_to_empty_spectrum(self):
+        wvls = WvlSpec(do_init=False)
+        wvls.add(550., 1.)
+
+        self.assertEqual(wvls.wavelengths, [550.])
+        self.assertEqual(wvls.spectral_wts, [1.])
+        self.assertEqual(wvls.central_wvl, 550.)
+        self.assertEqual(len(wvls.render_colors), 1)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=3)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+""" tests for batched ray setup and grid tracing
+
+.. codeauthor: Michael J. Hayford
+"""
+
+import unittest
+from pathlib import Path
+
+import numpy as np
+import numpy.testing as npt
+import pandas as pd
+
+import rayoptics as ro
+from rayoptics.gui.appcmds import open_model
+from rayoptics.raytr import trace
+from rayoptics.raytr.traceerror import TraceError
+import rayoptics.optical.model_constants as mc
+
+
+class TraceBatchTestCase(unittest.TestCase):
+    def setUp(self):
+        root_pth = Path(ro.__file__).resolve().parent
+        self.opm = open_model(root_pth/'codev/tests/ag_dblgauss.seq')
+        osp = self.opm['optical_spec']
+        self.fld, self.wvl, self.foc = osp.lookup_fld_wvl_focus(2)
+        # vignette all four quadrants of the pupil, by different amounts
+        self.fld.vux, self.fld.vlx = 0.1, 0.2
+        self.fld.vuy, self.fld.vly = 0.3, 0.4
+
+    def test_trace_base_batch_matches_trace_base(self):
+        pupils = np.array([[0., 0.], [1., 0.], [-1., 0.], [0., 1.],
+                           [0., -1.], [0.5, -0.5], [-0.7, 0.7]])
+        pt0, dirs, vig_pupils = trace.trace_base_batch(self.opm, pupils,
+                                                       self.fld)
+        npt.assert_allclose(vig_pupils,
+                            self.fld.apply_vignetting_batch(pupils))
+        for pupil, dir0 in zip(pupils, dirs):
+            ray, op, wvl = trace.trace_base(self.opm, list(pupil), self.fld,
+                                            self.wvl)
+            npt.assert_allclose(pt0, ray[0][mc.p], rtol=1e-14, atol=1e-14)
+            npt.assert_allclose(dir0, ray[0][mc.d], rtol=1e-12, atol=1e-14)
+
+    def test_trace_grid_with_filters(self):
+        def img_filter(p, ray_result):
+            if ray_result is None or isinstance(ray_result, TraceError):
+                return np.array([p[0], p[1], np.nan, np.nan])
+            final_seg, op_delta, wvl = ray_result
+            return np.array([p[0], p[1],
+                             final_seg[mc.p][0], final_seg[mc.p][1]])
+
+        num = 5
+        grid = trace.trace_grid(self.opm, ([-1., -1.], [1., 1.], num),
+                                self.fld, self.wvl, self.foc,
+                                img_filter=img_filter,
+                                output_filter='last',
+                                rayerr_filter='summary')
+        self.assertEqual(grid.shape, (num, num, 4))
+        # the grid is reported at the vignetted pupil coordinates
+        npt.assert_allclose(grid[0, 0, :2], [-0.8, -0.6])
+        npt.assert_allclose(grid[-1, -1, :2], [0.9, 0.7])
+
+
+class TraceFieldDataFrameTestCase(unittest.TestCase):
+    def setUp(self):
+        root_pth = Path(ro.__file__).resolve().parent
+        self.opm = open_model(root_pth/'codev/tests/ag_dblgauss.seq')
+        self.osp = self.opm['optical_spec']
+
+    def concat_field(self, fld, wvl, foc):
+        """ the boundary ray DataFrame, built per ray and concatenated """
+        pupil = self.osp.pupil
+        rdf_list = trace.trace_ray_list_at_field(self.opm, pupil.pupil_rays,
+                                                 fld, wvl, foc)
+        return pd.concat(rdf_list, keys=pupil.ray_labels, names=['pupil'])
+
+    def test_trace_field(self):
+        fld, wvl, foc = self.osp.lookup_fld_wvl_focus(2)
+        rset = trace.trace_field(self.opm, fld, wvl, foc)
+        pd.testing.assert_frame_equal(rset, self.concat_field(fld, wvl, foc))
+
+    def test_trace_all_fields(self):
+        fov = self.osp.field_of_view
+        fld, wvl, foc = self.osp.lookup_fld_wvl_focus(0)
+        fset = [self.concat_field(f, wvl, foc) for f in fov.fields]
+        fdf = pd.concat(fset, keys=fov.index_labels, names=['field'])
+        pd.testing.assert_frame_equal(trace.trace_all_fields(self.opm), fdf)
+
+    def test_trace_all_fields_extra_fields(self):
+        # fields without an index label are dropped, as pd.concat(keys=) did
+        fov = self.osp.field_of_view
+        fov.index_labels = fov.index_labels[:2]
+        fdf = trace.trace_all_fields(self.opm)
+        self.assertEqual(list(fdf.index.unique(level='field')),
+                         fov.index_labels)
+
+    def test_trace_all_fields_no_fields(self):
+        self.osp.field_of_view.fields = []
+        fdf = trace.trace_all_fields(self.opm)
+        self.assertEqual(len(fdf), 0)
+        self.assertEqual(fdf.index.names, ['field', 'pupil', 'intrfc'])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=3)
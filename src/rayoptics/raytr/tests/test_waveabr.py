@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+""" tests for reference sphere setup
+
+.. codeauthor: Michael J. Hayford
+"""
+
+import unittest
+from math import sqrt
+from pathlib import Path
+
+import numpy as np
+import numpy.testing as npt
+
+import rayoptics as ro
+from rayoptics.gui.appcmds import open_model
+from rayoptics.raytr import trace
+from rayoptics.raytr import waveabr_hhh
+from rayoptics.raytr.waveabr import calc_ref_sphere_dir_radius
+
+
+class RefSphereDirRadiusTestCase(unittest.TestCase):
+    def test_dir_radius(self):
+        image_pt = np.array([3., 4., -2.])
+        exp_pt = np.array([0., 0., -10.])
+        ref_dir, radius = calc_ref_sphere_dir_radius(image_pt, exp_pt, 20.)
+
+        # image pt wrt the final interface is [3, 4, 18]
+        self.assertAlmostEqual(radius, sqrt(9. + 16. + 28.**2), places=12)
+        npt.assert_allclose(ref_dir, np.array([3., 4., 28.])/radius,
+                            rtol=1e-14)
+        # the caller's image point isn't shifted by the gap thickness
+        npt.assert_array_equal(image_pt, [3., 4., -2.])
+
+    def test_zero_radius(self):
+        exp_pt = np.array([1., 2., 5.])
+        ref_dir, radius = calc_ref_sphere_dir_radius([1., 2., 0.], exp_pt, 5.)
+        self.assertEqual(radius, 0.)
+        npt.assert_array_equal(ref_dir, [0., 0., 0.])
+
+
+class CanonicalCoordsTestCase(unittest.TestCase):
+    def setUp(self):
+        root_pth = Path(ro.__file__).resolve().parent
+        self.opm = open_model(root_pth/'codev/tests/ag_dblgauss.seq')
+        osp = self.opm['optical_spec']
+        self.fld, self.wvl, self.foc = osp.lookup_fld_wvl_focus(1)
+
+    def test_shared_chief_ray(self):
+        ref_sphere_pkg, cr = waveabr_hhh.setup_canonical_coords(
+            self.opm, self.fld, self.wvl)
+        chief_ray_pkg = self.fld.chief_ray
+        self.assertIs(chief_ray_pkg[0], cr)
+
+        # setup_pupil_coords reuses the chief ray package on the field
+        ref_sphere, cr_pkg = trace.setup_pupil_coords(self.opm, self.fld,
+                                                      self.wvl, 0.)
+        self.assertIs(cr_pkg, chief_ray_pkg)
+        image_pt, ref_dir, ref_sphere_radius = ref_sphere
+        self.assertAlmostEqual(ref_sphere_pkg[0][-1], ref_sphere_radius,
+                               places=12)
+        npt.assert_allclose(ref_sphere_pkg[0][-2], ref_dir, rtol=1e-14)
+
+    def test_wave_abr_HHH_after_setup(self):
+        ref_sphere_pkg, cr = waveabr_hhh.setup_canonical_coords(
+            self.opm, self.fld, self.wvl)
+        opd, e1, ekp, ep = waveabr_hhh.wave_abr_HHH(self.fld, self.wvl,
+                                                    self.foc, cr)
+        self.assertAlmostEqual(opd, 0., places=12)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=3)
@@ -93,12 +93,33 @@ def trace_safe(opt_model, pupil, fld, wvl,
     """
     use_named_tuples = kwargs.get('use_named_tuples', False)
 
-    ray_result = None
-
     try:
         ray_pkg = trace_base(opt_model, pupil, fld, wvl,
                                    **kwargs)
     except TraceError as rayerr:
+        ray_pkg = rayerr
+
+    return filter_ray_result(ray_pkg, output_filter, rayerr_filter,
+                             use_named_tuples=use_named_tuples)
+
+
+def filter_ray_result(ray_pkg, output_filter, rayerr_filter,
+                      use_named_tuples=False):
+    """Apply the output and ray error filters of :func:`trace_safe`.
+
+    Args:
+        ray_pkg: the traced ray package, or the TraceError the trace raised
+        output_filter: see :func:`trace_safe`
+        rayerr_filter: see :func:`trace_safe`
+        use_named_tuples: if True, return RayPkg and RaySeg instances
+
+    Returns:
+        ray_result: see discussion of filters in :func:`trace_safe`.
+    """
+    ray_result = None
+
+    if isinstance(ray_pkg, TraceError):
+        rayerr = ray_pkg
         if rayerr_filter is None:
             pass
         elif rayerr_filter == 'full':
@@ -171,7 +192,34 @@ def trace(seq_model, pt0, dir0, wvl, **kwargs):
     return rt.trace(seq_model, pt0, dir0, wvl, **kwargs)
 
 
-def trace_base(opt_model, pupil, fld, wvl, apply_vignetting=True, **kwargs):
+def trace_base_setup(opt_model, fld):
+    """Return the ray starting data common to all rays traced from **fld**.
+
+    The result can be passed to :func:`trace_base` as **ray_start_data** so
+    that a sweep of rays at a single field does the lookups only once.
+
+    Args:
+        opt_model: instance of :class:`~.OpticalModel` to trace
+        fld: instance of :class:`~.Field`
+
+    Returns:
+        (**pt0**, **eprad**, **aim_pt**, **enp_z**)
+
+        - **pt0** - starting point of the ray on the object interface
+        - **eprad** - paraxial entrance pupil radius
+        - **aim_pt** - x, y aim point on the paraxial entrance pupil plane
+        - **enp_z** - distance from the object to the entrance pupil
+    """
+    fod = opt_model['analysis_results']['parax_data'].fod
+    aim_pt = np.array([0., 0.])
+    if hasattr(fld, 'aim_pt') and fld.aim_pt is not None:
+        aim_pt = fld.aim_pt
+    pt0 = opt_model.optical_spec.obj_coords(fld)
+    return pt0, fod.enp_radius, aim_pt, fod.obj_dist+fod.enp_dist
+
+
+def trace_base(opt_model, pupil, fld, wvl, apply_vignetting=True,
+               ray_start_data=None, **kwargs):
     """Trace ray specified by relative aperture and field point.
 
     Args:
@@ -179,6 +227,8 @@ def trace_base(opt_model, pupil, fld, wvl, apply_vignetting=True, **kwargs):
         pupil: relative pupil coordinates of ray
         fld: instance of :class:`~.Field`
         wvl: ray trace wavelength in nm
+        ray_start_data: if not None, the result of :func:`trace_base_setup`
+                        for **fld**
         **kwargs: keyword arguments
 
     Returns:
@@ -197,16 +247,12 @@ def trace_base(opt_model, pupil, fld, wvl, apply_vignetting=True, **kwargs):
           optical axis
         - **wvl** - wavelength (in nm) that the ray was traced in
     """
+    if ray_start_data is None:
+        ray_start_data = trace_base_setup(opt_model, fld)
+    pt0, eprad, aim_pt, enp_z = ray_start_data
     vig_pupil = fld.apply_vignetting(pupil) if apply_vignetting else pupil
-    osp = opt_model.optical_spec
-    fod = opt_model['analysis_results']['parax_data'].fod
-    eprad = fod.enp_radius
-    aim_pt = np.array([0., 0.])
-    if hasattr(fld, 'aim_pt') and fld.aim_pt is not None:
-        aim_pt = fld.aim_pt
     pt1 = np.array([eprad*vig_pupil[0]+aim_pt[0], eprad*vig_pupil[1]+aim_pt[1],
-                    fod.obj_dist+fod.enp_dist])
-    pt0 = osp.obj_coords(fld)
+                    enp_z])
     dir0 = pt1 - pt0
     length = norm(dir0)
     dir0 = dir0/length
@@ -218,6 +264,48 @@ def trace_base(opt_model, pupil, fld, wvl, apply_vignetting=True, **kwargs):
     return rt.trace(sm, pt0, dir0, wvl, **kwargs)
 
 
+def trace_base_batch(opt_model, pupils, fld, apply_vignetting=True,
+                     ray_start_data=None):
+    """Compute the starting point and directions for a set of pupil rays.
+
+    This does the ray setup of :func:`trace_base` for all of the **pupils**
+    at once; the rays can then be traced with :func:`~.raytrace.trace`.
+
+    Args:
+        opt_model: instance of :class:`~.OpticalModel` to trace
+        pupils: Nx2 array of relative pupil coordinates
+        fld: instance of :class:`~.Field`
+        apply_vignetting: if True, apply the vignetting factors of **fld**
+        ray_start_data: if not None, the result of :func:`trace_base_setup`
+                        for **fld**
+
+    Returns:
+        (**pt0**, **dir0**, **vig_pupils**)
+
+        - **pt0** - starting point of the rays on the object interface
+        - **dir0** - Nx3 array of starting direction cosines
+        - **vig_pupils** - Nx2 array of the (vignetted) pupil coordinates
+          the rays were set up with
+    """
+    if ray_start_data is None:
+        ray_start_data = trace_base_setup(opt_model, fld)
+    pt0, eprad, aim_pt, enp_z = ray_start_data
+    if apply_vignetting:
+        vig_pupils = fld.apply_vignetting_batch(pupils)
+    else:
+        vig_pupils = np.asarray(pupils, dtype=np.float64)[:, :2]
+
+    pt1 = np.empty((len(vig_pupils), 3))
+    pt1[:, :2] = eprad*vig_pupils + aim_pt[:2]
+    pt1[:, 2] = enp_z
+    dir0 = pt1 - pt0
+    dir0 /= norm(dir0, axis=1, keepdims=True)
+    # To handle virtual object distances, always propagate from 
+    #  the object in a positive Z direction.
+    dir0[dir0[:, 2]*opt_model.seq_model.z_dir[0] < 0] *= -1
+    return pt0, dir0, vig_pupils
+
+
 def iterate_ray(opt_model, ifcx, xy_target, fld, wvl, **kwargs):
     """ iterates a ray to xy_target on interface ifcx, returns aim points on
     the paraxial entrance pupil plane
@@ -331,9 +419,11 @@ def trace_boundary_rays_at_field(opt_model, fld, wvl, use_named_tuples=False):
     """
     rim_rays = []
     osp = opt_model.optical_spec
-    for p in osp.pupil.pupil_rays:
+    sm = opt_model.seq_model
+    pt0, dirs, _ = trace_base_batch(opt_model, osp.pupil.pupil_rays, fld)
+    for dir0 in dirs:
         try:
-            ray, op, wvl = trace_base(opt_model, p, fld, wvl)
+            ray, op, wvl = rt.trace(sm, pt0, dir0, wvl)
         except TraceError as ray_error:
             ray, op, wvl = ray_error.ray_pkg
 
@@ -364,34 +454,68 @@ def trace_boundary_rays(opt_model, **kwargs):
 def trace_ray_list_at_field(opt_model, ray_list, fld, wvl, foc):
     """ returns a list of ray |DataFrame| for the ray_list at field fld """
     rayset = []
+    ray_start_data = trace_base_setup(opt_model, fld)
     for p in ray_list:
-        ray, op, wvl = trace_base(opt_model, p, fld, wvl)
+        ray, op, wvl = trace_base(opt_model, p, fld, wvl,
+                                  ray_start_data=ray_start_data)
         rayset.append(ray)
     rdf_list = [ray_df(r) for r in rayset]
     return rdf_list
 
 
+def trace_field_segs(opt_model, fld, wvl):
+    """ returns the ray segments and pupil labels of the boundary rays at fld
+
+    The ray segments of all of the boundary rays are accumulated in a single
+    list, ray by ray. trace_base raises on a failed ray, so every ray has a
+    segment for each interface.
+    """
+    pupil = opt_model.optical_spec.pupil
+    ray_segs = []
+    labels = []
+    ray_start_data = trace_base_setup(opt_model, fld)
+    for lbl, p in zip(pupil.ray_labels, pupil.pupil_rays):
+        ray, op, wvl = trace_base(opt_model, p, fld, wvl,
+                                  ray_start_data=ray_start_data)
+        ray_segs += ray
+        labels.append(lbl)
+    return ray_segs, labels
+
+
 def trace_field(opt_model, fld, wvl, foc):
     """ returns a |DataFrame| with the boundary rays for field fld """
-    osp = opt_model.optical_spec
-    pupil_rays = osp.pupil.pupil_rays
-    rdf_list = trace_ray_list_at_field(opt_model, pupil_rays, fld, wvl, foc)
-    rset = pd.concat(rdf_list, keys=osp.pupil.ray_labels,
-                     names=['pupil'])
+    # build the DataFrame in a single step from all of the ray segments
+    ray_segs, labels = trace_field_segs(opt_model, fld, wvl)
+    num_segs = len(ray_segs)//len(labels) if len(labels) > 0 else 0
+    idx = pd.MultiIndex.from_product([labels, range(num_segs)],
+                                     names=['pupil', 'intrfc'])
+    rset = pd.DataFrame(ray_segs, index=idx,
+                        columns=['inc_pt', 'after_dir', 'after_dst', 'normal'])
     return rset
 
 
 def trace_all_fields(opt_model):
     """ returns a |DataFrame| with the boundary rays for all fields """
     osp = opt_model.optical_spec
-    fld, wvl, foc = osp.lookup_fld_wvl_focus(0)
-    fset = []
-    for f in osp.field_of_view.fields:
-        rset = trace_field(opt_model, f, wvl, foc)
-        fset.append(rset)
-
-    fdf = pd.concat(fset, keys=osp.field_of_view.index_labels,
-                    names=['field'])
+    wvl = osp.spectral_region.central_wvl
+    # accumulate the ray segments for all of the fields and build the
+    #  DataFrame in a single step, rather than concatenating a DataFrame
+    #  per field
+    fov = osp.field_of_view
+    ray_segs = []
+    fld_labels = []
+    labels = []
+    # pair fields and labels like pd.concat(keys=...), ignoring any extras
+    for fld_lbl, f in zip(fov.index_labels, fov.fields):
+        fld_segs, labels = trace_field_segs(opt_model, f, wvl)
+        ray_segs += fld_segs
+        fld_labels.append(fld_lbl)
+    num_rays = len(fld_labels)*len(labels)
+    num_segs = len(ray_segs)//num_rays if num_rays > 0 else 0
+    idx = pd.MultiIndex.from_product([fld_labels, labels, range(num_segs)],
+                                     names=['field', 'pupil', 'intrfc'])
+    fdf = pd.DataFrame(ray_segs, index=idx,
+                       columns=['inc_pt', 'after_dir', 'after_dst', 'normal'])
     return fdf
 
 
@@ -413,14 +537,15 @@ def trace_chief_ray(opt_model, fld, wvl, foc):
 
 def trace_fan(opt_model, fan_rng, fld, wvl, foc, img_filter=None,
               **kwargs):
-    start = np.array(fan_rng[0])
-    stop = fan_rng[1]
-    num = fan_rng[2]
-    step = (stop - start)/(num - 1)
+    pupils = np.linspace(fan_rng[0], fan_rng[1], fan_rng[2])
+    # the results are reported at the vignetted pupil coordinates
+    pt0, dirs, pupils = trace_base_batch(
+        opt_model, pupils, fld,
+        apply_vignetting=kwargs.pop('apply_vignetting', True))
+    sm = opt_model.seq_model
     fan = []
-    for r in range(num):
-        pupil = np.array(start)
-        ray, op, wvl = trace_base(opt_model, pupil, fld, wvl, **kwargs)
+    for pupil, dir0 in zip(pupils, dirs):
+        ray, op, wvl = rt.trace(sm, pt0, dir0, wvl, **kwargs)
         # opl = rt.calc_optical_path(ray, opt_model.seq_model.path())
         ray_pkg = ray, op, wvl
 
@@ -430,31 +555,45 @@ def trace_fan(opt_model, fan_rng, fld, wvl, foc, img_filter=None,
         else:
             fan.append([pupil, ray_pkg])
 
-        start += step
     return fan
 
 
 def trace_grid(opt_model, grid_rng, fld, wvl, foc, img_filter=None,
                form='grid', append_if_none=True, **kwargs):
-    output_filter = kwargs.get('output_filter', None)
-    rayerr_filter = kwargs.get('rayerr_filter', None)
-    start = np.array(grid_rng[0])
+    output_filter = kwargs.pop('output_filter', None)
+    rayerr_filter = kwargs.pop('rayerr_filter', None)
+    use_named_tuples = kwargs.pop('use_named_tuples', False)
+    start = grid_rng[0]
     stop = grid_rng[1]
     num = grid_rng[2]
-    step = np.array((stop - start)/(num - 1))
+    # generate the pupil coordinates up front rather than accumulating steps
+    pupil_x = np.linspace(start[0], stop[0], num)
+    pupil_y = np.linspace(start[1], stop[1], num)
+    pupils = np.stack(np.meshgrid(pupil_x, pupil_y, indexing='ij'), axis=-1)
+    pupils = pupils.reshape(num*num, 2)
+    # the results are reported at the vignetted pupil coordinates
+    pt0, dirs, pupils = trace_base_batch(
+        opt_model, pupils, fld,
+        apply_vignetting=kwargs.pop('apply_vignetting', True))
+    pupils = pupils.reshape(num, num, 2)
+    dirs = dirs.reshape(num, num, 3)
+    sm = opt_model.seq_model
     grid = []
-    for i in range(num):
+    for pupil_row, dir_row in zip(pupils, dirs):
         if form == 'list':
             working_grid = grid
         elif form == 'grid':
             grid_row = []
             working_grid = grid_row
 
-        for j in range(num):
-            pupil = np.array(start)
-            ray_result = trace_safe(opt_model, pupil, fld, wvl, 
-                                    output_filter, rayerr_filter, 
-                                    check_apertures=True, **kwargs)
+        for pupil, dir0 in zip(pupil_row, dir_row):
+            try:
+                ray_pkg = rt.trace(sm, pt0, dir0, wvl, check_apertures=True,
+                                   **kwargs)
+            except TraceError as rayerr:
+                ray_pkg = rayerr
+            ray_result = filter_ray_result(ray_pkg, output_filter,
+                                           rayerr_filter, use_named_tuples)
             if ray_result is not None:
                 if img_filter:
                     result = img_filter(pupil, ray_result)
@@ -470,11 +609,8 @@ def trace_grid(opt_model, grid_rng, fld, wvl, foc, img_filter=None,
                     if append_if_none:
                         working_grid.append([pupil[0], pupil[1], None])
 
-            start[1] += step[1]
         if form == 'grid':
             grid.append(grid_row)
-        start[0] += step[0]
-        start[1] = grid_rng[0][1]
     return np.array(grid)
 
 
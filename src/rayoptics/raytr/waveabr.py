@@ -16,8 +16,6 @@ import numpy as np
 from rayoptics.optical import model_constants as mc
 from rayoptics.elem.transform import transform_after_surface
 
-from rayoptics.util.misc_math import normalize
-
 
 def calculate_reference_sphere(opt_model, fld, wvl, foc, 
                                chief_ray_pkg, 
@@ -54,21 +52,42 @@ def calculate_reference_sphere(opt_model, fld, wvl, foc,
     if image_delta is not None:
         image_pt[:2] += image_delta
 
-    # get the image point wrt the final surface
     image_thi = opt_model['seq_model'].gaps[-1].thi
-    img_pt = np.array(image_pt)
-    img_pt[2] += image_thi
-
-    # R' radius of reference sphere for O'
-    ref_sphere_vec = img_pt - cr_exp_seg[mc.p]
-    ref_sphere_radius = np.linalg.norm(ref_sphere_vec)
-    ref_dir = normalize(ref_sphere_vec)
+    ref_dir, ref_sphere_radius = calc_ref_sphere_dir_radius(
+        image_pt, cr_exp_seg[mc.p], image_thi)
 
     ref_sphere = (image_pt, ref_dir, ref_sphere_radius)
 
     return ref_sphere
 
 
+def calc_ref_sphere_dir_radius(image_pt, exp_pt, image_thi):
+    """Return the direction and radius of the reference sphere for image_pt.
+
+    Args:
+        image_pt: image point, wrt the image interface
+        exp_pt: center of the reference sphere on the exit pupil, wrt the
+                final interface
+        image_thi: thickness of the gap before the image interface
+
+    Returns:
+        (**ref_dir**, **ref_sphere_radius**)
+    """
+    # get the image point wrt the final surface
+    img_pt = np.array(image_pt)
+    img_pt[2] += image_thi
+
+    # R' radius of reference sphere for O'
+    #  take the length and direction cosine from a single dot product
+    ref_sphere_vec = img_pt - exp_pt
+    ref_sphere_radius = sqrt(ref_sphere_vec.dot(ref_sphere_vec))
+    if ref_sphere_radius == 0.0:
+        ref_dir = ref_sphere_vec
+    else:
+        ref_dir = ref_sphere_vec*(1.0/ref_sphere_radius)
+    return ref_dir, ref_sphere_radius
+
+
 def transfer_to_exit_pupil(interface, ray_seg, exp_dst_parax):
     """Given the exiting interface and chief ray data, return exit pupil ray coords.
 
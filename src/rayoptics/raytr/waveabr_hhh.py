@@ -21,11 +21,9 @@ import numpy as np
 
 from rayoptics.optical import model_constants as mc
 
-from . import RayPkg
-from .trace import trace_base
-from .waveabr import eic_distance, transfer_to_exit_pupil
+from .trace import get_chief_ray_pkg
+from .waveabr import eic_distance, calc_ref_sphere_dir_radius
 
-from rayoptics.util.misc_math import normalize
 from rayoptics.elem.transform import (transform_before_surface,
                                       transform_after_surface)
 
@@ -270,33 +268,24 @@ def wave_abr_full_calc_HHH(opm, fod, fld, wvl, foc, path,
 def setup_canonical_coords(opt_model, fld, wvl, image_pt=None):
     seq_model = opt_model.seq_model
     parax_data = opt_model['analysis_results']['parax_data']
-    fod = parax_data.fod
 
-    if fld.chief_ray is None:
-        ray, op, wvl = trace_base(opt_model, [0., 0.], fld, wvl)
-        fld.chief_ray = RayPkg(ray, op, wvl)
-    cr = fld.chief_ray
+    # share the chief ray and its exit pupil segment with setup_pupil_coords
+    chief_ray_pkg = get_chief_ray_pkg(opt_model, fld, wvl, 0.)
+    fld.chief_ray = chief_ray_pkg
+    cr, cr_exp_seg = chief_ray_pkg
 
     if image_pt is None:
         image_pt = cr.ray[-1][mc.p]
 
     # cr_exp_pt: E upper bar prime: pupil center for pencils from Q
     # cr_exp_pt, cr_b4_dir, cr_dst
-    cr_exp_seg = transfer_to_exit_pupil(seq_model.ifcs[-2],
-                                        (cr.ray[-2][mc.p],
-                                         cr.ray[-2][mc.d]),
-                                         fod.exp_dist)
     cr_exp_pt = cr_exp_seg[mc.p]
     cr_exp_dist = cr_exp_seg[mc.dst]
 
     img_dist = seq_model.gaps[-1].thi
-    img_pt = np.array(image_pt)
-    img_pt[2] += img_dist
-
-    # R' radius of reference sphere for O'
-    ref_sphere_vec = img_pt - cr_exp_pt
-    ref_sphere_radius = np.linalg.norm(ref_sphere_vec)
-    ref_dir = normalize(ref_sphere_vec)
+    ref_dir, ref_sphere_radius = calc_ref_sphere_dir_radius(image_pt,
+                                                            cr_exp_pt,
+                                                            img_dist)
 
     ref_sphere = (image_pt, cr_exp_pt, cr_exp_dist,
                   ref_dir, ref_sphere_radius)
@@ -316,8 +305,9 @@ def wave_abr_HHH(fld, wvl, foc, ray_pkg):
 .. deprecated:: 0.4.9
     """
     ref_sphere, parax_data, n_obj, n_img, z_dir = fld.ref_sphere
-    image_pt, cr_exp_pt, ref_dir, ref_sphere_radius = ref_sphere
-    chief_ray, chief_ray_op, wvl = fld.chief_ray
+    image_pt, cr_exp_pt, cr_exp_dist, ref_dir, ref_sphere_radius = ref_sphere
+    cr, cr_exp_seg = fld.chief_ray
+    chief_ray, chief_ray_op, wvl = cr
     ray, ray_op, wvl = ray_pkg
     ax_ray, pr_ray, fod = parax_data
     k = -2  # last interface in sequential model